@@ -160,7 +160,7 @@ def convert2to3(sbol2_doc: Union[str, sbol2.Document], namespaces=None) -> sbol3
 
     report = doc.validate()
     if len(report):
-        report_string = "\n".join(str(e) for e in doc.validate())
+        report_string = "\n".join(str(e) for e in report)
         raise ValueError(f'Conversion from SBOL2 to SBOL3 produced an invalid document: {report_string}')
 
     return doc
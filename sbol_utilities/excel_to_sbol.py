@@ -207,7 +207,7 @@ def row_to_basic_part(doc: sbol3.Document, row, basic_parts: sbol3.Collection, l
 # form of a sub-component:
 # X: identifies a component or set thereof
 # RC(X): X is reversed
-reverse_complement_pattern = re.compile('RC\(.+\)')
+reverse_complement_pattern = re.compile(r'RC\(.+\)')
 # Returns sanitized text without optional reverse complement marker
 def strip_RC(name):
     sanitized = name.strip()
@@ -255,7 +255,7 @@ def make_composite_component(display_id,part_lists,reverse_complements):
     # return the completed part
     return composite_part
 
-constraint_pattern = re.compile('Part (\d+) (.+) Part (\d+)')
+constraint_pattern = re.compile(r'Part (\d+) (.+) Part (\d+)')
 constraint_dict = {'same as': sbol3.SBOL_VERIFY_IDENTICAL,
                    'different from': sbol3.SBOL_DIFFERENT_FROM,
                    'same orientation as': sbol3.SBOL_SAME_ORIENTATION_AS,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import logging
 import itertools
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
 from contextlib import contextmanager
+from types import MappingProxyType
 from typing import Iterable, Union, Optional, Callable
 
 import sbol3
@@ -48,11 +49,15 @@ def build_reference_cache(doc: sbol3.Document) -> dict[str, sbol3.Identified]:
     :param doc: an sbol3 Document
     :returns: a cache of identities
     """
+    # Walk the object tree with an explicit stack rather than doc.traverse,
+    # which costs a recursive call and a callback invocation per object
     cache = {}
-
-    def cache_identity(obj: sbol3.Identified):
+    stack = list(doc.objects)
+    while stack:
+        obj = stack.pop()
         cache[obj.identity] = obj
-    doc.traverse(cache_identity)
+        for children in obj._owned_objects.values():
+            stack.extend(children)
     return cache
 
 
@@ -72,21 +77,43 @@ def cached_references(doc: sbol3.Document) -> Generator[dict[str, sbol3.Identifi
         find_top_level(component1.sequences[0])
     ```
 
+    Nested uses on the same document share a single cache, which is built
+    on entry to the outermost context and removed on exit from it.
+
     :param doc: an sbol3 Document
     :returns: a generator of a reference cache
     """
-    # An existing cache is tucked away so that it can be restored when
-    # this context is exited.
+    # Count the contexts open on this document so that nested contexts
+    # re-use the cache rather than rebuilding it.
+    depth = getattr(doc, '_sbol_utilities_reference_cache_depth', 0)
+    if depth == 0:
+        doc._sbol_utilities_reference_cache = build_reference_cache(doc)
+    doc._sbol_utilities_reference_cache_depth = depth + 1
     try:
-        old_cache = doc._sbol_utilities_reference_cache
-    except AttributeError:
-        # AttributeError means the document does not already have a
-        # reference cache. Tuck away None as the preceding cache.
-        old_cache = None
-    doc._sbol_utilities_reference_cache = build_reference_cache(doc)
-    yield doc._sbol_utilities_reference_cache
-    # Restore the cache to what it was before
-    doc._sbol_utilities_reference_cache = old_cache
+        yield doc._sbol_utilities_reference_cache
+    finally:
+        doc._sbol_utilities_reference_cache_depth -= 1
+        # Remove the cache once the outermost context is exited
+        if doc._sbol_utilities_reference_cache_depth == 0:
+            del doc._sbol_utilities_reference_cache
+            del doc._sbol_utilities_reference_cache_depth
+
+
+def _cache_lookup(ref: ReferencedURI, cache: Optional[dict[str, sbol3.Identified]]) -> Optional[sbol3.Identified]:
+    """Look up a reference in a cache, falling back on the hidden cache of the reference's document
+
+    :param ref: reference to look up
+    :param cache: optional cache of identities; if None, the document cache from cached_references is used, if any
+    :returns: cached object, or None if there is no cache or the reference is not in it
+    """
+    if cache is None:
+        # If the `ref` does not have a parent or the document does not
+        # have the cache attribute, proceed without a cache
+        doc = getattr(getattr(ref, 'parent', None), 'document', None)
+        cache = getattr(doc, '_sbol_utilities_reference_cache', None)
+        if cache is None:
+            return None
+    return cache.get(str(ref))
 
 
 def find_child(ref: ReferencedURI, cache: Optional[dict[str, sbol3.Identified]] = None):
@@ -97,25 +124,9 @@ def find_child(ref: ReferencedURI, cache: Optional[dict[str, sbol3.Identified]]
     :returns: object pointed to by reference
     :raises ChildNotFound: if object cannot be retrieved
     """
-    if cache is None:
-        try:
-            doc = ref.parent.document
-            cache = doc._sbol_utilities_reference_cache
-        except AttributeError:
-            # AttributeError means that either the `ref` does not have
-            # a parent or the document does not have the cache
-            # attribute. In either case, proceed without a cache
-            pass
-    try:
-        return cache[str(ref)]
-    except KeyError:
-        # KeyError means the item was not found in the cache. Ignore
-        # the error and fall through to a lookup below.
-        pass
-    except TypeError:
-        # TypeError probably means the cache object is not subscriptable.
-        # Ignore the error and fall through to a lookup below.
-        pass
+    cached = _cache_lookup(ref, cache)
+    if cached is not None:
+        return cached
     child = ref.lookup()
     if not child:
         raise ChildNotFound(f'Could not find child object in document: {ref}')
@@ -132,25 +143,9 @@ def find_top_level(ref: ReferencedURI, cache: Optional[dict[str, sbol3.Identifie
     :returns: object pointed to by reference
     :raises TopLevelNotFound: if object cannot be retrieved
     """
-    if cache is None:
-        try:
-            doc = ref.parent.document
-            cache = doc._sbol_utilities_reference_cache
-        except AttributeError:
-            # AttributeError means that either the `ref` does not have
-            # a parent or the document does not have the cache
-            # attribute. In either case, proceed without a cache
-            pass
-    try:
-        return cache[str(ref)]
-    except KeyError:
-        # KeyError means the item was not found in the cache. Ignore
-        # the error and fall through to a lookup below.
-        pass
-    except TypeError:
-        # TypeError probably means the cache object is not subscriptable.
-        # Ignore the error and fall through to a lookup below.
-        pass
+    cached = _cache_lookup(ref, cache)
+    if cached is not None:
+        return cached
     top_level = ref.lookup()
     if not top_level:
         raise TopLevelNotFound(f'Could not find top-level object in document: {ref}')
@@ -176,15 +171,20 @@ def toplevel_named(doc: sbol3.Document, name: str) -> Optional[sbol3.TopLevel]:
         raise ValueError(f'Name is not unique: {name}')
 
 
-def filter_top_level(doc: sbol3.Document, filter: Callable[[sbol3.TopLevel], bool]) -> Iterable[sbol3.TopLevel]:
+def filter_top_level(doc: sbol3.Document, filter: Callable[[sbol3.TopLevel], bool], *,
+                     prefilter_type: Optional[type] = None) -> Iterable[sbol3.TopLevel]:
     """Filters and returns iterable of TopLevel Objects in a document,
     which match a criteria set by a callable argument.
 
     :param doc: SBOL Document to search
     :param filter: Callable acting as filter on List of TopLevel objects
+    :param prefilter_type: if set, only objects of this type are passed to the filter
     :return: TopLevel iterator satisfying given filter
     """
-    return (obj for obj in doc.objects if filter(obj))
+    objects = doc.objects
+    if prefilter_type is not None:
+        objects = (obj for obj in objects if isinstance(obj, prefilter_type))
+    return (obj for obj in objects if filter(obj))
 
 
 def strip_sbol2_version(identity: str) -> str:
@@ -194,25 +194,33 @@ def strip_sbol2_version(identity: str) -> str:
     :param identity: URI to be sanitized
     :return: URI without terminal version, if any
     """
-    last_segment = identity.split('/')[-1]
+    head, sep, last_segment = identity.rpartition('/')
+    if not sep:  # without a "/", there is no version segment to strip
+        return identity
     try:
         _ = int(last_segment)  # if last segment is a number...
-        return identity.rsplit('/', 1)[0]  # ... then return everything else
+        return head  # ... then return everything else
     except ValueError:  # if last segment was not a number, there is no version to strip
         return identity
 
 
 # TODO: replace with EDAM format entries when SBOL2 and SBOL3 can be differentiated
-GENETIC_DESIGN_FILE_TYPES = {
-    'FASTA': {'.fasta', '.fa'},
-    'GenBank': {'.genbank', '.gb'},
-    'SBOL2': {'.xml'},
-    'SBOL3': {sbol3.NTRIPLES: {'.nt'},
-              sbol3.RDF_XML: {'.rdf'},
-              sbol3.TURTLE: {'.ttl'},
-              sbol3.JSONLD: {'.json', '.jsonld'}
-              }
-}
+# Read-only, because the extension lookup below is built from it once, at import
+GENETIC_DESIGN_FILE_TYPES = MappingProxyType({
+    'FASTA': frozenset({'.fasta', '.fa'}),
+    'GenBank': frozenset({'.genbank', '.gb'}),
+    'SBOL2': frozenset({'.xml'}),
+    'SBOL3': MappingProxyType({sbol3.NTRIPLES: frozenset({'.nt'}),
+                               sbol3.RDF_XML: frozenset({'.rdf'}),
+                               sbol3.TURTLE: frozenset({'.ttl'}),
+                               sbol3.JSONLD: frozenset({'.json', '.jsonld'})
+                               })
+})
+
+
+# Map from each known extension to its file type, for constant-time lookup
+_EXTENSION_FILE_TYPES = {x: t for t, v in GENETIC_DESIGN_FILE_TYPES.items()
+                         for x in (itertools.chain(*v.values()) if isinstance(v, Mapping) else v)}
 
 
 def design_file_type(name: str) -> Optional[str]:
@@ -221,14 +229,8 @@ def design_file_type(name: str) -> Optional[str]:
     :param name: file name (path allowed)
     :return: type name (from GENETIC_DESIGN_FILE_TYPES) if known, None if not
     """
-    for t, v in GENETIC_DESIGN_FILE_TYPES.items():
-        if isinstance(v, set):
-            if any(x for x in v if name.endswith(x)):
-                return t
-        else:  # dictionary
-            if any(sub for sub in v.values() if any(x for x in sub if name.endswith(x))):
-                return t
-    return None
+    _, sep, extension = name.rpartition('.')
+    return _EXTENSION_FILE_TYPES.get(sep + extension)
 
 
 def strip_filetype_suffix(identity: str) -> str:
@@ -237,12 +239,8 @@ def strip_filetype_suffix(identity: str) -> str:
     :param identity: URL to sanitize
     :return: sanitized URL
     """
-    extensions = itertools.chain(*((itertools.chain(*v.values()) if isinstance(v, dict) else v)
-                                   for v in GENETIC_DESIGN_FILE_TYPES.values()))
-    for x in extensions:
-        if identity.endswith(x):
-            return identity[:-(len(x))]  # TODO: change to removesuffix when python 3.9 is the minimum version
-    return identity
+    head, sep, extension = identity.rpartition('.')
+    return head if sep + extension in _EXTENSION_FILE_TYPES else identity
 
 
 def url_to_identity(url: str) -> str:
@@ -251,8 +249,8 @@ def url_to_identity(url: str) -> str:
     :param url: URL to sanitize
     :return: equivalent identity
     """
-    split = url.rsplit('/', maxsplit=1)
-    return f'{split[0]}/{sbol3.string_to_display_id(split[1])}'
+    head, sep, tail = url.rpartition('/')
+    return f'{head}{sep}{sbol3.string_to_display_id(tail)}'
 
 
 def is_plasmid(obj: Union[sbol3.Component, sbol3.Feature]) -> bool:
@@ -334,29 +332,19 @@ def outgoing_links(doc: sbol3.Document) -> set[URIRef]:
     :param doc: an SBOL document
     :return: set of URIs for objects not contained in the document
     """
-    # build a cache and look for all references that cannot be resolved
-    def collector(obj: sbol3.Identified):
+    def references(obj: sbol3.Identified) -> Iterable[str]:
         # Collect all ReferencedURI values in properties:
-        references = []
         for pv in obj.__dict__.values():
             if isinstance(pv, ReferencedObjectList):
-                references.extend([v for v in pv if isinstance(v, ReferencedURI)])
+                yield from (str(v) for v in pv if isinstance(v, ReferencedURI))
             elif isinstance(pv, ReferencedObjectSingleton):
-                references.append(pv.get())
-
-        # Check whether or not the references resolve
-        for r in references:
-            try:
-                _ = find_top_level(r)
-            except TopLevelNotFound:
-                outgoing.add(str(r))
-            except ValueError:
-                pass  # ignore references to child objects
+                ref = pv.get()
+                if ref is not None:
+                    yield str(ref)
 
-    outgoing = set()
-    with cached_references(doc):
-        doc.traverse(collector)
-    return outgoing
+    # build the cache once, then collect every reference that it cannot resolve
+    cache = build_reference_cache(doc)
+    return {r for obj in cache.values() for r in references(obj) if r not in cache}
 
 def is_circular(obj: Union[sbol3.Component, sbol3.LocalSubComponent, sbol3.ExternallyDefined]) -> bool:
     """Check if an SBOL Component or Feature is circular.
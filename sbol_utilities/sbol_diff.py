@@ -1,9 +1,10 @@
 import argparse
+import filecmp
 import logging
 import os
 import sys
 import time
-from typing import Union, Tuple, Optional, Sequence
+from typing import Union, Optional, Sequence
 
 import rdflib.compare
 import sbol3
@@ -16,13 +17,6 @@ def _load_rdf(fpath: Union[str, bytes, os.PathLike]) -> rdflib.Graph:
     return graph1
 
 
-def _diff_graphs(g1: rdflib.Graph, g2: rdflib.Graph) -> Tuple[rdflib.Graph, rdflib.Graph, rdflib.Graph]:
-    iso1 = rdflib.compare.to_isomorphic(g1)
-    iso2 = rdflib.compare.to_isomorphic(g2)
-    rdf_diff = rdflib.compare.graph_diff(iso1, iso2)
-    return rdf_diff
-
-
 def _report_triples(header: Optional[str], graph: rdflib.Graph) -> None:
     if header:
         print(header)
@@ -43,7 +37,11 @@ def _report_diffs(desc1: str, in1: rdflib.Graph,
 
 def _diff_rdf(desc1: str, g1: rdflib.Graph, desc2: str, g2: rdflib.Graph,
               silent: bool = False) -> int:
-    _, in1, in2 = _diff_graphs(g1, g2)
+    # Canonicalize each graph once; with blank nodes labeled deterministically, set differences give the diff
+    cg1 = rdflib.compare.to_canonical_graph(g1)
+    cg2 = rdflib.compare.to_canonical_graph(g2)
+    in1 = cg1 - cg2
+    in2 = cg2 - cg1
     if not in1 and not in2:
         return 0
     else:
@@ -61,6 +59,10 @@ def file_diff(fpath1: str, fpath2: str, silent: bool = False) -> int:
     :param silent: whether to report differences to stdout
     :return: 1 if there are differences, 0 if they are the same
     """
+    # Byte-identical files in the same format hold the same graph, so there is no need to parse them
+    if rdflib.util.guess_format(fpath1) == rdflib.util.guess_format(fpath2) and \
+            filecmp.cmp(fpath1, fpath2, shallow=False):
+        return 0
     return _diff_rdf(fpath1, _load_rdf(fpath1), fpath2, _load_rdf(fpath2),
                      silent=silent)
 
@@ -75,6 +77,8 @@ def doc_diff(doc1: sbol3.Document, doc2: sbol3.Document,
     :param silent: whether to report differences to stdout
     :return: 1 if there are differences, 0 if they are the same
     """
+    if doc1 is doc2:
+        return 0
     return _diff_rdf('Document 1', doc1.graph(), 'Document 2', doc2.graph(),
                      silent=silent)
 
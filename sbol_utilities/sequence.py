@@ -5,6 +5,11 @@ import sbol3
 ############################
 # Utilities for working with SBOL Sequence objects
 
+# Translation tables deleting each alphabet's characters: a sequence is unambiguous if nothing is left afterward
+_DNA_CHARACTERS = str.maketrans('', '', 'acgtACGT')
+_RNA_CHARACTERS = str.maketrans('', '', 'acguACGU')
+_PROTEIN_CHARACTERS = str.maketrans('', '', 'acdefghiklmnpqrstvwyACDEFGHIKLMNPQRSTVWY')
+
 
 def unambiguous_dna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
     """Check if a sequence consists only of unambiguous DNA characters
@@ -16,7 +21,7 @@ def unambiguous_dna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
         if sequence.encoding != sbol3.IUPAC_DNA_ENCODING:
             return False
         sequence = sequence.elements
-    return sequence.lower().strip('acgt') == ''
+    return not sequence.translate(_DNA_CHARACTERS)
 
 
 def unambiguous_rna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
@@ -29,7 +34,7 @@ def unambiguous_rna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
         if sequence.encoding != sbol3.IUPAC_RNA_ENCODING:
             return False
         sequence = sequence.elements
-    return sequence.lower().strip('acgu') == ''
+    return not sequence.translate(_RNA_CHARACTERS)
 
 
 def unambiguous_protein_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
@@ -42,4 +47,4 @@ def unambiguous_protein_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
         if sequence.encoding != sbol3.IUPAC_PROTEIN_ENCODING:
             return False
         sequence = sequence.elements
-    return sequence.lower().strip('acdefghiklmnpqrstvwy') == ''
+    return not sequence.translate(_PROTEIN_CHARACTERS)
@@ -44,7 +44,8 @@ def sort_owned_objects(self):
 # Kludges for copying certain types of TopLevel objects
 # TODO: delete after resolution of https://github.com/SynBioDex/pySBOL3/issues/235, along with following functions
 def copy_toplevel_and_dependencies(target, t):
-    if not target.find(t.identity):
+    # Only TopLevel identities can collide; Document.find would also search every child object on a miss
+    if not any(o.identity == t.identity for o in target.objects):
         if isinstance(t, sbol3.Collection):
             copy_collection_and_dependencies(target, t)
         elif isinstance(t, sbol3.Component):
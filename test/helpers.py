@@ -1,15 +1,20 @@
 import difflib
+import filecmp
 import tempfile
 import os
+import re
 from shutil import copy
 from typing import List, Dict
 
+import sbol3
 
-def copy_to_tmp(package: List[str] = None, renames: Dict[str, str] = None) -> str:
+
+def copy_to_tmp(package: List[str] = None, renames: Dict[str, str] = None, parent: str = None) -> str:
     """Copy test files into a temporary package directory
 
     :param package: files to go into the temporary package directory
     :param renames: dictionary of files to be renamed when copied, mapping old name to new
+    :param parent: directory to create the temporary directory in; defaults to the system temporary directory
     :return: temporary package directory
     """
     # make a temporary package directory
@@ -17,7 +22,7 @@ def copy_to_tmp(package: List[str] = None, renames: Dict[str, str] = None) -> st
         package = []
     if renames is None:
         renames = {}
-    tmp_dir = tempfile.mkdtemp()
+    tmp_dir = tempfile.mkdtemp(dir=parent)
     tmp_sub = os.path.join(tmp_dir, 'test_package')
     os.mkdir(tmp_sub)
     # copy all of the relevant files
@@ -29,15 +34,59 @@ def copy_to_tmp(package: List[str] = None, renames: Dict[str, str] = None) -> st
     return tmp_sub
 
 
-def assert_files_identical(file1: os.PathLike, file2: os.PathLike) -> None:
+# Line ranges in a unified diff hunk header, e.g., "@@ -497,6 +497,6 @@"
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@')
+
+
+def _raise_diff(lines1: List[str], lines2: List[str], name1: str, name2: str, context: int) -> None:
+    """Raise an AssertionError reporting the diff of two different sequences of lines
+
+    :param lines1: lines of the first text
+    :param lines2: lines of the second text
+    :param name1: name of the first text in the report
+    :param name2: name of the second text in the report
+    :param context: number of lines around the first difference to include in the report
+    """
+    # Only diff a window around the first differing line, so the cost of reporting does not grow with file size
+    first = next((i for i, (l1, l2) in enumerate(zip(lines1, lines2)) if l1 != l2), min(len(lines1), len(lines2)))
+    start = max(first - context, 0)
+    diff = difflib.unified_diff(lines1[start:first + context], lines2[start:first + context],
+                                fromfile=name1, tofile=name2)
+    # difflib numbers lines from the start of the window, so shift hunk headers back to file line numbers
+    def shift(match: re.Match) -> str:
+        return f'@@ -{int(match[1]) + start}{match[2] or ""} +{int(match[3]) + start}{match[4] or ""} @@'
+    diff_str = ''.join(_HUNK_HEADER.sub(shift, line) for line in diff)
+    raise AssertionError(f"File differs from expected value starting at line {first + 1}:\n" + diff_str)
+
+
+def assert_files_identical(file1: os.PathLike, file2: os.PathLike, context: int = 100) -> None:
     """check if two files are identical; if not, report their diff
     :param file1: path of first file to compare
     :param file2: path of second file to compare
+    :param context: number of lines around the first difference to include in the report
     :return: true if
     """
+    if filecmp.cmp(file1, file2, shallow=False):
+        return
     with open(file1, 'r') as f1:
         with open(file2, 'r') as f2:
-            diff = difflib.unified_diff(f1.readlines(), f2.readlines(), fromfile=str(file1), tofile=str(file2))
-    diff_str = ''.join(diff)
-    if diff_str:
-        raise AssertionError("File differs from expected value:\n" + diff_str)
+            lines1, lines2 = f1.readlines(), f2.readlines()
+    if lines1 != lines2:  # identical lines means only line endings differ
+        _raise_diff(lines1, lines2, str(file1), str(file2), context)
+
+
+def assert_serialization_identical(doc: sbol3.Document, expected: os.PathLike, context: int = 100) -> None:
+    """check if a document serializes to sorted N-Triples identical to a file; if not, report their diff
+    This gives the same result as writing the document to a file and comparing with assert_files_identical,
+    without the temporary file.
+
+    :param doc: document to serialize
+    :param expected: path of file containing the expected serialization
+    :param context: number of lines around the first difference to include in the report
+    """
+    serialized = doc.write_string(sbol3.SORTED_NTRIPLES)
+    with open(expected, 'r') as f:
+        expected_text = f.read()
+    if serialized != expected_text:
+        _raise_diff(serialized.splitlines(keepends=True), expected_text.splitlines(keepends=True),
+                    'serialized document', str(expected), context)
@@ -11,19 +11,19 @@ import sbol3
 import sbol_utilities.calculate_sequences
 from sbol_utilities.excel_to_sbol import excel_to_sbol
 from sbol_utilities.expand_combinatorial_derivations import expand_derivations
+from helpers import assert_serialization_identical
+
+TEST_FILES = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
 
 
 class TestCalculateSequences(unittest.TestCase):
     def test_calculate_sequences(self):
         """Test inference of sequences"""
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
-        test_dir = os.path.dirname(os.path.realpath(__file__))
         doc = sbol3.Document()
-        doc.read(os.path.join(test_dir, 'test_files', 'expanded_simple_library.nt'))
+        doc.read(os.path.join(TEST_FILES, 'expanded_simple_library.nt'))
         prior_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         new_seqs = sbol_utilities.calculate_sequences.calculate_sequences(doc)
-        tmp_out = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
 
         # check to see if all of the expected sequences have been filled in as anticipated
         # total number of new sequences should be: 20
@@ -36,22 +36,20 @@ class TestCalculateSequences(unittest.TestCase):
         assert sequence_count - prior_sequence_count == len(new_seqs)
         # spot-check a couple of sequence lengths
 
+        # make sure that what came out is exactly what was expected
+        assert_serialization_identical(doc, os.path.join(TEST_FILES, 'expanded_with_sequences.nt'))
+
         # run it again: no additional sequences should get computed
         new_seqs = sbol_utilities.calculate_sequences.calculate_sequences(doc)
         second_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         self.assertTrue(not new_seqs and sequence_count == second_sequence_count,
                         f'Unexpected new sequences {new_seqs}')
 
-        # make sure that what came out is exactly what was expected
-        comparison_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
-        assert filecmp.cmp(tmp_out, comparison_file), f'Converted file {tmp_out} is not identical'
-
     def test_circular_calculation(self):
         """Test sequence inference on two different types of circular builds plasmids;
         one fully marked, one partly"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
         # prep the document
-        wb_name = os.path.join(test_dir, 'test_files', 'circular_inference_test.xlsx')
+        wb_name = os.path.join(TEST_FILES, 'circular_inference_test.xlsx')
         wb = openpyxl.load_workbook(wb_name, data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = excel_to_sbol(wb)
@@ -65,8 +63,6 @@ class TestCalculateSequences(unittest.TestCase):
 
         prior_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         new_seqs = sbol_utilities.calculate_sequences.calculate_sequences(doc)
-        tmp_out = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
 
         # check to see if all of the expected sequences have been filled in as anticipated
         # total number of new sequences should be: 10
@@ -85,24 +81,24 @@ class TestCalculateSequences(unittest.TestCase):
                    'GAGAGAGAGAATATATATATTCTCTCTCTCCGCGCGCGCGGAGAGAGAGAATATATATATTCTCTCTCTCCGCGCGCGCGGAGAGAGAGA'
         assert doc.find('Test2_Test2_ins_J23101_sequence').elements == expected
 
+        # make sure that what came out is exactly what was expected
+        assert_serialization_identical(doc, os.path.join(TEST_FILES, 'circular_sequence_inference.nt'))
+
         # run it again: no additional sequences should get computed
         new_seqs = sbol_utilities.calculate_sequences.calculate_sequences(doc)
         second_sequence_count = len([o for o in doc.objects if isinstance(o, sbol3.Sequence)])
         assert not new_seqs and sequence_count == second_sequence_count, f'Unexpected new sequences {new_seqs}'
 
-        # make sure that what came out is exactly what was expected
-        comparison_file = os.path.join(test_dir, 'test_files', 'circular_sequence_inference.nt')
-        assert filecmp.cmp(tmp_out, comparison_file), f'Converted file {tmp_out} is not identical'
-
     def test_commandline(self):
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        test_args = ['sbol-calculate-sequences', '-vv',
-                     os.path.join(test_dir, 'test_files', 'expanded_simple_library.nt'), '-o', temp_name]
-        with patch.object(sys, 'argv', test_args):
-            sbol_utilities.calculate_sequences.main()
-        comparison_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
-        assert filecmp.cmp(temp_name, comparison_file), f'Converted file {temp_name} is not identical'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_name = os.path.join(tmp_dir, 'out.nt')
+            test_args = ['sbol-calculate-sequences', '-vv',
+                         os.path.join(TEST_FILES, 'expanded_simple_library.nt'), '-o', temp_name]
+            with patch.object(sys, 'argv', test_args):
+                sbol_utilities.calculate_sequences.main()
+            comparison_file = os.path.join(TEST_FILES, 'expanded_with_sequences.nt')
+            assert filecmp.cmp(temp_name, comparison_file, shallow=False), \
+                f'Converted file {temp_name} is not identical'
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,3 @@
-import filecmp
-import os
-import tempfile
 import unittest
 from pathlib import Path
 
@@ -18,6 +15,9 @@ from sbol_utilities.component import dna_component_with_sequence, rna_component_
 from sbol_utilities.component import ed_restriction_enzyme, backbone, part_in_backbone
 from sbol_utilities.helper_functions import find_top_level, toplevel_named, TopLevelNotFound, outgoing_links
 from sbol_utilities.sbol_diff import doc_diff    
+from helpers import assert_serialization_identical
+
+TEST_FILES = Path(__file__).resolve().parent / 'test_files'
 
 
 class TestComponent(unittest.TestCase):
@@ -66,17 +66,12 @@ class TestComponent(unittest.TestCase):
                          [ensure_singleton_feature(system, gfp_cds)])
 
         # confirm that the system constructed is exactly as expected
-        tmp_out = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(tmp_out, sbol3.SORTED_NTRIPLES)
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'component_construction.nt')
-        assert filecmp.cmp(tmp_out, comparison_file), f'Converted file {tmp_out} is not identical'
+        assert_serialization_identical(doc, str(TEST_FILES / 'component_construction.nt'))
 
     def test_containment(self):
         """Test the operation of the contained_components function"""
         doc = sbol3.Document()
-        test_dir = Path(__file__).parent
-        doc.read(str(test_dir / 'test_files' / 'constraints_library.nt'))
+        doc.read(str(TEST_FILES / 'constraints_library.nt'))
 
         # Total of 43 parts, 2 non-library composites, 6 templates, 2 inserts
         self.assertEqual(len(contained_components(doc.objects)), 53)
@@ -92,7 +87,7 @@ class TestComponent(unittest.TestCase):
         self.assertEqual(len(contained_components(toplevel_named(doc, 'Two color - operon'))), 23)
 
         # Test again with an incomplete file. Should fail when missing elements are requested, but not when untouched
-        doc.read(str(test_dir / 'test_files' / 'incomplete_constraints_library.nt'))
+        doc.read(str(TEST_FILES / 'incomplete_constraints_library.nt'))
         self.assertRaises(TopLevelNotFound, lambda: contained_components(doc.objects))
         self.assertEqual(len(contained_components(toplevel_named(doc, 'BB-B0032-BB'))), 4)
         self.assertRaises(TopLevelNotFound, lambda: contained_components(toplevel_named(doc, 'Multicolor expression')))
@@ -16,12 +16,27 @@ from helpers import copy_to_tmp
 from sbol_utilities.sbol_diff import doc_diff
 # TODO: Add command-line utilities and test them too
 
+TEST_FILES = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
+
 
 class Test2To3Conversion(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Test packages and command-line outputs go into a directory that is removed when the class is done
+        cls._tmp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp_dir.cleanup()
+
+    def _temp_path(self, suffix: str = '') -> str:
+        """Return a path in the class temporary directory that is unique to the running test"""
+        return os.path.join(self._tmp_dir.name, self._testMethodName + suffix)
+
     def test_convert_identities(self):
         """Test conversion of a complex file"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        input_path = os.path.join(test_dir, 'test_files', 'sbol3-small-molecule.rdf')
+        input_path = os.path.join(TEST_FILES, 'sbol3-small-molecule.rdf')
         doc = convert2to3(input_path)
         # check for issues in converted document
         report = doc.validate()
@@ -31,8 +46,7 @@ class Test2To3Conversion(unittest.TestCase):
 
     def test_convert_object(self):
         """Test conversion of a loaded SBOL2 document"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        input_path = os.path.join(test_dir, 'test_files', 'sbol3-small-molecule.rdf')
+        input_path = os.path.join(TEST_FILES, 'sbol3-small-molecule.rdf')
         doc2 = sbol2.Document()
         doc2.read(input_path)
         doc = convert2to3(doc2)
@@ -45,9 +59,8 @@ class Test2To3Conversion(unittest.TestCase):
     def test_3to2_conversion(self):
         """Test ability to convert from SBOL3 to SBOL2"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['BBa_J23101.nt'])
         doc3 = sbol3.Document()
-        doc3.read(os.path.join(tmp_sub, 'BBa_J23101.nt'))
+        doc3.read(os.path.join(TEST_FILES, 'BBa_J23101.nt'))
 
         # Convert to SBOL2 and check contents
         doc2 = convert3to2(doc3)
@@ -70,7 +83,7 @@ class Test2To3Conversion(unittest.TestCase):
     def test_combinatorial_derivation_3_2_conversion(self):
         """Test ability to convert combinatorial derivations between SBOL3 and SBOL2"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['constraints_library.nt'])
+        tmp_sub = copy_to_tmp(package=['constraints_library.nt'], parent=self._tmp_dir.name)
         doc3 = sbol3.Document()
         doc3.read(os.path.join(tmp_sub, 'constraints_library.nt'))
 
@@ -89,14 +102,14 @@ class Test2To3Conversion(unittest.TestCase):
         doc3.write(outfile)
 
         # check round trip
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'constraints_library.nt')
-        assert filecmp.cmp(outfile, comparison_file), f'Round-tripped file {outfile} is not identical'
+        comparison_file = os.path.join(TEST_FILES, 'constraints_library.nt')
+        assert filecmp.cmp(outfile, comparison_file, shallow=False), f'Round-tripped file {outfile} is not identical'
 
     def test_3to2_orientation_conversion(self):
         """Test ability to convert orientation from SBOL3to SBOL2"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['iGEM_SBOL2_imports.nt', 'feature_orientation_conversion.nt'])
+        tmp_sub = copy_to_tmp(package=['iGEM_SBOL2_imports.nt', 'feature_orientation_conversion.nt'],
+                              parent=self._tmp_dir.name)
         doc3 = sbol3.Document()
         doc3.read(os.path.join(tmp_sub, 'iGEM_SBOL2_imports.nt'))
 
@@ -129,7 +142,7 @@ class Test2To3Conversion(unittest.TestCase):
 
         # also check the feeature orientations are getting converted
         doc3 = sbol3.Document()
-        doc3.read('test/test_files/feature_orientation_conversion.nt')
+        doc3.read(os.path.join(tmp_sub, 'feature_orientation_conversion.nt'))
         # Convert to SBOL2 and check contents
         doc2 = convert3to2(doc3)
         try:
@@ -141,27 +154,25 @@ class Test2To3Conversion(unittest.TestCase):
     def test_genbank_conversion(self):
         """Test ability to convert from SBOL3 to GenBank"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['BBa_J23101.nt'])
         doc3 = sbol3.Document()
-        doc3.read(os.path.join(tmp_sub, 'BBa_J23101.nt'))
+        doc3.read(os.path.join(TEST_FILES, 'BBa_J23101.nt'))
 
         # Convert to GenBank and check contents
-        outfile = os.path.join(tmp_sub, 'BBa_J23101.gb')
+        outfile = self._temp_path('.gb')
         convert_to_genbank(doc3, outfile)
 
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101.gb')
-        assert filecmp.cmp(outfile, comparison_file), f'Converted GenBank file {comparison_file} is not identical'
+        comparison_file = os.path.join(TEST_FILES, 'BBa_J23101.gb')
+        assert filecmp.cmp(outfile, comparison_file, shallow=False), \
+            f'Converted GenBank file {comparison_file} is not identical'
 
     def test_conversion_from_genbank(self):
         """Test ability to convert from GenBank to SBOL3"""
         # Get the GenBank test document and convert
-        tmp_sub = copy_to_tmp(package=['BBa_J23101.gb'])
+        tmp_sub = copy_to_tmp(package=['BBa_J23101.gb'], parent=self._tmp_dir.name)
         doc3 = convert_from_genbank(os.path.join(tmp_sub, 'BBa_J23101.gb'), 'https://synbiohub.org/public/igem')
 
         # Note: cannot directly round-trip because converter is a) lossy, and b) inserts extra materials
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101_from_genbank.nt')
+        comparison_file = os.path.join(TEST_FILES, 'BBa_J23101_from_genbank.nt')
         comparison_doc = sbol3.Document()
         comparison_doc.read(comparison_file)
         assert not doc_diff(doc3, comparison_doc), f'Converted GenBank file not identical to {comparison_file}'
@@ -169,7 +180,7 @@ class Test2To3Conversion(unittest.TestCase):
     def test_genbank_multi_conversion(self):
         """Test ability to convert from SBOL3 to GenBank"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['iGEM_SBOL2_imports.nt'])
+        tmp_sub = copy_to_tmp(package=['iGEM_SBOL2_imports.nt'], parent=self._tmp_dir.name)
         doc3 = sbol3.Document()
         doc3.read(os.path.join(tmp_sub, 'iGEM_SBOL2_imports.nt'))
 
@@ -177,35 +188,33 @@ class Test2To3Conversion(unittest.TestCase):
         outfile = os.path.join(tmp_sub, 'iGEM_SBOL2_imports.gb')
         convert_to_genbank(doc3, outfile)
 
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'iGEM_SBOL2_imports.gb')
-        assert filecmp.cmp(outfile, comparison_file), f'Converted GenBank file {comparison_file} is not identical'
+        comparison_file = os.path.join(TEST_FILES, 'iGEM_SBOL2_imports.gb')
+        assert filecmp.cmp(outfile, comparison_file, shallow=False), \
+            f'Converted GenBank file {comparison_file} is not identical'
 
     def test_fasta_conversion(self):
         """Test ability to convert from SBOL3 to FASTA"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['BBa_J23101.nt'])
         doc3 = sbol3.Document()
-        doc3.read(os.path.join(tmp_sub, 'BBa_J23101.nt'))
+        doc3.read(os.path.join(TEST_FILES, 'BBa_J23101.nt'))
 
         # Convert to FASTA and check contents
-        outfile = os.path.join(tmp_sub, 'BBa_J23101.fasta')
+        outfile = self._temp_path('.fasta')
         convert_to_fasta(doc3, outfile)
 
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101.fasta')
-        assert filecmp.cmp(outfile, comparison_file), f'Converted FASTA file {comparison_file} is not identical'
+        comparison_file = os.path.join(TEST_FILES, 'BBa_J23101.fasta')
+        assert filecmp.cmp(outfile, comparison_file, shallow=False), \
+            f'Converted FASTA file {comparison_file} is not identical'
 
     def test_conversion_from_fasta(self):
         """Test ability to convert from SBOL3 to FASTA"""
         """Test ability to convert from GenBank to SBOL3"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['BBa_J23101.fasta'])
+        tmp_sub = copy_to_tmp(package=['BBa_J23101.fasta'], parent=self._tmp_dir.name)
         doc3 = convert_from_fasta(os.path.join(tmp_sub, 'BBa_J23101.fasta'), 'https://synbiohub.org/public/igem')
 
         # Note: cannot directly round-trip because converter is lossy
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101_from_fasta.nt')
+        comparison_file = os.path.join(TEST_FILES, 'BBa_J23101_from_fasta.nt')
         comparison_doc = sbol3.Document()
         comparison_doc.read(comparison_file)
         assert not doc_diff(doc3, comparison_doc), f'Converted FASTA file not identical to {comparison_file}'
@@ -214,27 +223,25 @@ class Test2To3Conversion(unittest.TestCase):
         """Test ability to convert from SBOL3 to FASTA"""
         """Test ability to convert from GenBank to SBOL3"""
         # Get the SBOL3 test document
-        tmp_sub = copy_to_tmp(package=['BBa_J23101.fasta'])
+        tmp_sub = copy_to_tmp(package=['BBa_J23101.fasta'], parent=self._tmp_dir.name)
         doc3 = convert_from_fasta(os.path.join(tmp_sub, 'BBa_J23101.fasta'), 'https://synbiohub.org/public/igem',
                                   identity_map={'BBa_J23101': 'https://somewhere_else.org/public/igem/BBa_J23101'})
 
         # Note: cannot directly round-trip because converter is lossy
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        comparison_file = os.path.join(test_dir, 'test_files', 'BBa_J23101_from_fasta_altname.nt')
+        comparison_file = os.path.join(TEST_FILES, 'BBa_J23101_from_fasta_altname.nt')
         comparison_doc = sbol3.Document()
         comparison_doc.read(comparison_file)
         assert not doc_diff(doc3, comparison_doc), f'Converted FASTA file not identical to {comparison_file}'
 
     def test_commandline(self):
-        test_files = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
-        temp_name = tempfile.mkstemp()[1]
+        temp_name = self._temp_path()
         test_file = {
-            'fasta': os.path.join(test_files, 'BBa_J23101.fasta'),
-            'genbank': os.path.join(test_files, 'BBa_J23101.gb'),
-            'from_fasta': os.path.join(test_files, 'BBa_J23101_from_fasta.nt'),
-            'from_genbank': os.path.join(test_files, 'BBa_J23101_from_genbank.nt'),
-            'sbol3': os.path.join(test_files, 'BBa_J23101.nt'),
-            'sbol323': os.path.join(test_files, 'BBa_J23101_3to2to3.nt')
+            'fasta': os.path.join(TEST_FILES, 'BBa_J23101.fasta'),
+            'genbank': os.path.join(TEST_FILES, 'BBa_J23101.gb'),
+            'from_fasta': os.path.join(TEST_FILES, 'BBa_J23101_from_fasta.nt'),
+            'from_genbank': os.path.join(TEST_FILES, 'BBa_J23101_from_genbank.nt'),
+            'sbol3': os.path.join(TEST_FILES, 'BBa_J23101.nt'),
+            'sbol323': os.path.join(TEST_FILES, 'BBa_J23101_3to2to3.nt')
         }
 
         # Run the generic command-line converter with a couple of different configurations:
@@ -242,59 +249,66 @@ class Test2To3Conversion(unittest.TestCase):
                      test_file['fasta']]
         with patch.object(sys, 'argv', test_args):
             main()
-        assert filecmp.cmp(temp_name, test_file['from_fasta']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['from_fasta'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
         test_args = ['sbol-converter', '-o', temp_name, 'SBOL3', 'SBOL3', test_file['sbol3']]
         with patch.object(sys, 'argv', test_args):
             main()
-        assert filecmp.cmp(temp_name, test_file['sbol3']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['sbol3'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
         # Run the other six tests
         test_args = ['fasta2sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', test_file['fasta']]
         with patch.object(sys, 'argv', test_args):
             fasta2sbol()
-        assert filecmp.cmp(temp_name, test_file['from_fasta']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['from_fasta'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
         # genbank conversion should succeed the same way when not online if not given an online argument
         test_args = ['genbank2sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', test_file['genbank']]
         with patch.object(sys, 'argv', test_args):
             genbank2sbol()
-        assert filecmp.cmp(temp_name, test_file['from_genbank']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['from_genbank'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
         test_args = ['sbol2fasta', '-o', temp_name, test_file['sbol3']]
         with patch.object(sys, 'argv', test_args):
             sbol2fasta()
-        assert filecmp.cmp(temp_name, test_file['fasta']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['fasta'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
         test_args = ['sbol2genbank', '-o', temp_name, test_file['sbol3']]
         with patch.object(sys, 'argv', test_args):
             sbol2genbank()
-        assert filecmp.cmp(temp_name, test_file['genbank']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['genbank'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
         # SBOL2 serialization is not stable, so test via round-trip instead
         test_args = ['sbol3to2', '-o', temp_name, test_file['sbol3']]
         with patch.object(sys, 'argv', test_args):
             sbol3to2()
-        temp_name_2 = tempfile.mkstemp()[1]
+        temp_name_2 = self._temp_path('_2')
         test_args = ['sbol2to3', '-o', temp_name_2, temp_name]
         with patch.object(sys, 'argv', test_args):
             sbol2to3()
-        assert filecmp.cmp(temp_name_2, test_file['sbol323']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name_2, test_file['sbol323'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
     def test_online_conversion(self):
         """Test whether we are able to use the online converter"""
-        test_files = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'test_files')
-        temp_name = tempfile.mkstemp()[1]
+        temp_name = self._temp_path()
         test_file = {
-            'genbank': os.path.join(test_files, 'BBa_J23101.gb'),
-            'from_genbank': os.path.join(test_files, 'BBa_J23101_from_genbank.nt'),
+            'genbank': os.path.join(TEST_FILES, 'BBa_J23101.gb'),
+            'from_genbank': os.path.join(TEST_FILES, 'BBa_J23101_from_genbank.nt'),
         }
 
         test_args = ['genbank2sbol', '-o', temp_name, '-n', 'https://synbiohub.org/public/igem', test_file['genbank'],
                      '--allow-genbank-online']
         with patch.object(sys, 'argv', test_args):
             genbank2sbol()
-        assert filecmp.cmp(temp_name, test_file['from_genbank']), f'Converted file {temp_name} is not identical'
+        assert filecmp.cmp(temp_name, test_file['from_genbank'], shallow=False), \
+            f'Converted file {temp_name} is not identical'
 
 
 if __name__ == '__main__':
@@ -17,21 +17,23 @@ logging.getLogger().setLevel(level=logging.DEBUG)
 
 
 class TestExcel2SBOL(unittest.TestCase):
+
     def test_conversion(self):
         """Basic smoke test of Excel to SBOL3 conversion"""
         wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'simple_library.xlsx'), data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb)
 
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert len(report) == 0, "\n".join(str(issue) for issue in report)
         assert len(doc.find('BasicParts').members) == 26
         assert len(doc.find('CompositeParts').members) == 6
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
+        expected = sbol3.Document()
+        expected.read(os.path.join(TESTFILE_DIR, 'simple_library.nt'))
+        self.assertFalse(sbol_diff.doc_diff(doc, expected))
 
     def test_custom_conversion(self):
         """Test if conversion works correctly when the config us used to change expected sheet structure"""
@@ -54,30 +56,32 @@ class TestExcel2SBOL(unittest.TestCase):
         }
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb, config)
 
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert len(report) == 0, "\n".join(str(issue) for issue in report)
         assert len(doc.find('BasicParts').members) == 26
         assert len(doc.find('CompositeParts').members) == 6
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
+        expected = sbol3.Document()
+        expected.read(os.path.join(TESTFILE_DIR, 'simple_library.nt'))
+        self.assertFalse(sbol_diff.doc_diff(doc, expected))
 
     def test_multi_backbone(self):
         """Check if generation works correctly when there is more than one backbone option"""
         wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'two_backbones.xlsx'), data_only=True)
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb)
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert len(report) == 0, "\n".join(str(issue) for issue in report)
         assert len(doc.find('BasicParts').members) == 9
         assert len(doc.find('CompositeParts').members) == 2
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'two_backbones.nt')))
+        expected = sbol3.Document()
+        expected.read(os.path.join(TESTFILE_DIR, 'two_backbones.nt'))
+        self.assertFalse(sbol_diff.doc_diff(doc, expected))
 
     def test_constraints(self):
         """Check if constraints are generated correctly"""
@@ -85,24 +89,26 @@ class TestExcel2SBOL(unittest.TestCase):
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         doc = sbol_utilities.excel_to_sbol.excel_to_sbol(wb)
 
-        assert not doc.validate().errors and not doc.validate().warnings
+        report = doc.validate()
+        assert len(report) == 0, "\n".join(str(issue) for issue in report)
         assert len(doc.find('BasicParts').members) == 43
         assert len(doc.find('CompositeParts').members) == 8
         assert len(doc.find('LinearDNAProducts').members) == 2
         assert len(doc.find('FinalProducts').members) == 2
 
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        doc.write(temp_name, sbol3.SORTED_NTRIPLES)
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'constraints_library.nt')))
+        expected = sbol3.Document()
+        expected.read(os.path.join(TESTFILE_DIR, 'constraints_library.nt'))
+        self.assertFalse(sbol_diff.doc_diff(doc, expected))
 
     def test_commandline(self):
         """Make sure function works correctly when run from the command line"""
-        temp_name = tempfile.mkstemp(suffix='.nt')[1]
-        test_args = ['excel-to-sbol', '-vv', os.path.join(TESTFILE_DIR, 'simple_library.xlsx'), '-o', temp_name, '-n',
-                     'http://sbolstandard.org/testfiles']
-        with patch.object(sys, 'argv', test_args):
-            sbol_utilities.excel_to_sbol.main()
-        self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_name = os.path.join(tmp_dir, 'out.nt')
+            test_args = ['excel-to-sbol', '-vv', os.path.join(TESTFILE_DIR, 'simple_library.xlsx'), '-o', temp_name,
+                         '-n', 'http://sbolstandard.org/testfiles']
+            with patch.object(sys, 'argv', test_args):
+                sbol_utilities.excel_to_sbol.main()
+            self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,14 +1,32 @@
-import unittest
 import os
+import tempfile
+import unittest
 from pathlib import Path
+from typing import Tuple
 
 from sbol_utilities import component
 
 from sbol_utilities.helper_functions import *
+from helpers import assert_files_identical
+
+TEST_FILES = Path(__file__).resolve().parent / 'test_files'
 
 
 class TestHelpers(unittest.TestCase):
 
+    @staticmethod
+    def _plant_sequence(doc: sbol3.Document) -> Tuple[sbol3.Component, sbol3.Sequence]:
+        """Add a Component to the document that refers to a Sequence that is not in the document
+
+        :param doc: document to add the Component to
+        :return: the added Component and its Sequence
+        """
+        sbol3.set_namespace('https://github.com/synbiodex/sbol-utilities')
+        sequence = sbol3.Sequence('seq1')
+        c1 = sbol3.Component('c1', types=[sbol3.SBO_DNA], sequences=[sequence])
+        doc.add(c1)
+        return c1, sequence
+
     def test_url_sanitization(self):
         # SBOL2 version stripping:
         uri = 'https://synbiohub.programmingbiology.org/public/Eco1C1G1T1/LmrA/1'
@@ -19,6 +37,10 @@ class TestHelpers(unittest.TestCase):
         expected = 'https://synbiohub.programmingbiology.org/public/Eco1C1G1T1/LmrA'
         self.assertEqual(strip_sbol2_version(uri), expected)
 
+        # an identity without any "/" has no version to strip, even if it is numeric
+        self.assertEqual(strip_sbol2_version('5'), '5')
+        self.assertEqual(strip_sbol2_version(' 1'), ' 1')
+
         # displayId cleaning:
         self.assertEqual(url_to_identity('http://foo/bar/baz.qux'), 'http://foo/bar/baz_qux')
 
@@ -30,15 +52,18 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(design_file_type('full path/full/path/something.genbank'), 'GenBank')
         self.assertEqual(strip_filetype_suffix('http://foo/bar/baz.gb'), 'http://foo/bar/baz')
         self.assertEqual(strip_filetype_suffix('http://foo/bar/baz.qux'), 'http://foo/bar/baz.qux')
+        # the file type table is read-only, since extension lookup does not see later changes to it
+        with self.assertRaises(TypeError):
+            GENETIC_DESIGN_FILE_TYPES['FASTA'] = {'.fna'}
+        with self.assertRaises(AttributeError):
+            GENETIC_DESIGN_FILE_TYPES['FASTA'].add('.fna')
 
     def test_filtering_top_level_objects(self):
         """Check filtering Top Level Objects by a condition"""
-        test_dir = os.path.dirname(os.path.realpath(__file__))
         sbol3.set_namespace('http://sbolstandard.org/testfiles')
         # we consider simple_library document for the test
-        simple_library = os.path.join(test_dir, 'test_files', 'simple_library.nt')
         doc = sbol3.Document()
-        doc.read(simple_library)
+        doc.read(str(TEST_FILES / 'simple_library.nt'))
 
         # we check for the no of dna parts in doc
         self.assertEqual(len(doc.objects), 68, f'Expected 34 TopLevel Objects, found {len(doc.objects)}')
@@ -46,11 +71,25 @@ class TestHelpers(unittest.TestCase):
         total_filtered = sum(1 for _ in itr)
         self.assertEqual(total_filtered, 24, f'Expected 24 Objects to satisfy filter, found {total_filtered}')
 
+    def test_filtering_top_level_objects_by_type(self):
+        """Check that a type prefilter keeps other Top Level Objects from reaching the filter"""
+        doc = sbol3.Document()
+        doc.read(str(TEST_FILES / 'simple_library.nt'))
+
+        # record what the filter is asked about; accessing types fails on anything but a Component
+        checked = []
+
+        def has_types(obj: sbol3.Component) -> bool:
+            checked.append(obj)
+            return bool(obj.types)
+        itr = filter_top_level(doc, has_types, prefilter_type=sbol3.Component)
+        self.assertEqual(sum(1 for _ in itr), 34)
+        self.assertEqual(len(checked), 34)
+        self.assertTrue(all(isinstance(obj, sbol3.Component) for obj in checked))
+
     def test_build_reference_cache(self):
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        test_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
         doc = sbol3.Document()
-        doc.read(test_file)
+        doc.read(str(TEST_FILES / 'expanded_with_sequences.nt'))
         cache = build_reference_cache(doc)
         # There are 529 occurrences of '22-rdf-syntax-ns#type' in expanded_with_sequences.nt,
         # which in this particular case means there are 529 separate sbol objects. That's not
@@ -58,10 +97,7 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(529, len(cache))
         # plant a fake item in the cache and make sure the relevant functions
         # find it. This tests that they are actually using the cache.
-        sbol3.set_namespace('https://github.com/synbiodex/sbol-utilities')
-        sequence = sbol3.Sequence('seq1')
-        c1 = sbol3.Component('c1', types=[sbol3.SBO_DNA], sequences=[sequence])
-        doc.add(c1)
+        c1, sequence = self._plant_sequence(doc)
         cache[sequence.identity] = sequence
         # The sequence is not found without the cache because it is not in the document
         with self.assertRaises(ChildNotFound):
@@ -78,10 +114,8 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(sequence, found_object)
 
     def test_with_cached_references(self):
-        test_dir = os.path.dirname(os.path.realpath(__file__))
-        test_file = os.path.join(test_dir, 'test_files', 'expanded_with_sequences.nt')
         doc = sbol3.Document()
-        doc.read(test_file)
+        doc.read(str(TEST_FILES / 'expanded_with_sequences.nt'))
         target_uri = 'http://sbolstandard.org/testfiles/mmilCFP'
         # The document should not have the secret reference cache attribute
         self.assertFalse(hasattr(doc, '_sbol_utilities_reference_cache'))
@@ -94,14 +128,18 @@ class TestHelpers(unittest.TestCase):
             self.assertIn(target_uri, doc._sbol_utilities_reference_cache)
             obj = doc.find(target_uri)
             self.assertEqual(target_uri, obj.identity)
+            # A nested context should share the cache of the enclosing context
+            outer_cache = doc._sbol_utilities_reference_cache
+            with cached_references(doc) as inner_cache:
+                self.assertIs(outer_cache, inner_cache)
+            self.assertIs(outer_cache, doc._sbol_utilities_reference_cache)
+        # The cache is removed when the outermost context exits
+        self.assertFalse(hasattr(doc, '_sbol_utilities_reference_cache'))
         # Make sure find_child and find_top_level are using the hidden cache
         with cached_references(doc) as reference_cache:
             # plant a fake item in the cache and make sure the relevant functions
             # find it. This tests that they are actually using the cache.
-            sbol3.set_namespace('https://github.com/synbiodex/sbol-utilities')
-            sequence = sbol3.Sequence('seq1')
-            c1 = sbol3.Component('c1', types=[sbol3.SBO_DNA], sequences=[sequence])
-            doc.add(c1)
+            c1, sequence = self._plant_sequence(doc)
             with self.assertRaises(ChildNotFound):
                 find_child(c1.sequences[0])
             with self.assertRaises(TopLevelNotFound):
@@ -121,8 +159,7 @@ class TestHelpers(unittest.TestCase):
     def test_outgoing(self):
         """Test the outgoing_links function"""
         doc = sbol3.Document()
-        test_dir = Path(__file__).parent
-        doc.read(str(test_dir / 'test_files' / 'incomplete_constraints_library.nt'))
+        doc.read(str(TEST_FILES / 'incomplete_constraints_library.nt'))
 
         expected = {'http://parts.igem.org/E0040',
                     'http://parts.igem.org/J23105_sequence',
@@ -136,6 +173,26 @@ class TestHelpers(unittest.TestCase):
                     'http://sbolstandard.org/testfiles/_4_FPs'}
         self.assertEqual(outgoing_links(doc), expected)
 
+    def test_diff_report_line_numbers(self):
+        """Check that a diff reported for a difference late in a file gives file line numbers"""
+        lines = [f'line {i}\n' for i in range(1, 601)]
+        changed = lines.copy()
+        changed[500] = 'changed\n'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file1 = os.path.join(tmp_dir, 'file1.txt')
+            file2 = os.path.join(tmp_dir, 'file2.txt')
+            with open(file1, 'w') as f:
+                f.writelines(lines)
+            with open(file2, 'w') as f:
+                f.writelines(changed)
+            with self.assertRaises(AssertionError) as cm:
+                assert_files_identical(file1, file2, context=3)
+        report = str(cm.exception)
+        self.assertIn('starting at line 501', report)
+        # the hunk starts at line 498, three lines of context before the change
+        self.assertIn('@@ -498,6 +498,6 @@', report)
+        self.assertIn('-line 501\n+changed\n', report)
+
 
 if __name__ == '__main__':
     unittest.main()
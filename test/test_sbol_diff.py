@@ -1,5 +1,6 @@
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -37,6 +38,15 @@ class TestSbolDiff(unittest.TestCase):
         actual = sbol_utilities.sbol_diff.file_diff(ESL_SBOL_PATH, SL_SBOL_PATH, silent=True)
         expected = 1
         self.assertEqual(expected, actual)
+        # The same graph serialized in a different order is not byte-identical, but has no differences
+        esl_doc = sbol3.Document()
+        esl_doc.read(ESL_SBOL_PATH)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            unsorted_path = os.path.join(tmp_dir, 'unsorted.nt')
+            esl_doc.write(unsorted_path, sbol3.NTRIPLES)
+            actual = sbol_utilities.sbol_diff.file_diff(ESL_SBOL_PATH, unsorted_path, silent=True)
+        expected = 0
+        self.assertEqual(expected, actual)
 
     def test_doc_diff(self):
         """Invoke sbol_utilities.sbol_diff.doc_diff directly"""